@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import islice
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson.JSONEncodeError (a TypeError) rejects e.g. lone surrogates,
+            # which json escapes as \uXXXX
+            pass
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson refuses escaped lone surrogates that json accepts; genuinely
+            # malformed data fails again below
+            pass
+    return json.loads(data)
+
 #Protocol
 class DataStore(ABC):
     
@@ -29,59 +59,178 @@ class DataStore(ABC):
     
     
     
-    class FileStore(DataStore):
-        def __init__(self, storage_dir: str="File_store"):
-            self.storage_dir=storage_dir
-            os.makedirs(storage_dir, exist_ok=True)
+# Characters that would let a FileStore key point outside its directory
+_UNSAFE_KEY_CHARS = frozenset(c for c in (os.sep, os.altsep, "\0") if c)
+
+
+class FileStore(DataStore):
+    def __init__(self, storage_dir: str="File_store", flush_threshold: int=128, cache_size: int=1024):
+        self.storage_dir=storage_dir
+        os.makedirs(storage_dir, exist_ok=True)
+        # Write-back cache: stores land in memory and are flushed to disk in batches.
+        # Dirty entries stay pinned until flushed; clean ones are evicted LRU-first
+        # once the cache holds more than cache_size entries.
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._flush_threshold = flush_threshold
+        self._cache_size = cache_size
+        # Joined once here so building a key's path is a plain string format
+        self._prefix = os.path.join(storage_dir, "")
+    
+    @staticmethod
+    def _is_valid_key(key: str) -> bool:
+        # Keys map straight onto file names, so they must not escape storage_dir
+        return bool(key) and not any(c in key for c in _UNSAFE_KEY_CHARS)
+    
+    def _get_file_path(self, key: str) -> str:
+        return f"{self._prefix}{key}.json"
+    
+    def _remember(self, key: str, value: str) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        self._evict_clean()
+    
+    def _evict_clean(self) -> None:
+        excess = len(self._cache) - self._cache_size
+        if excess <= 0:
+            return
+        # Scan from the least recently used end and stop once enough are found
+        clean = (k for k in self._cache if k not in self._dirty)
+        for key in list(islice(clean, excess)):
+            del self._cache[key]
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.flush()
+        except Exception:
+            pass
+    
+    def store(self, key:str, value:str) -> bool:
+        if not self._is_valid_key(key):
+            return False
+        self._dirty.add(key)
+        self._remember(key, value)
+        if len(self._dirty) >= self._flush_threshold:
+            return self.flush()
+        return True
+    
+    def flush(self) -> bool:
+        """Write every pending key to disk; returns False if any write failed.
+        
+        Each value is written and fsynced to a temp file, then renamed over the
+        target, so a crash leaves either the old or the new value, never a
+        half-written one; the directory is then synced once for the whole batch
+        so the renames themselves are durable.
+        """
+        ok = True
+        written = []
+        for key in list(self._dirty):
+            file_path = self._get_file_path(key)
+            tmp_path = file_path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps({"value": self._cache[key]}))
+                    f.flush()
+                    os.fsync(f.fileno())
+                written.append((key, tmp_path, file_path))
+            except (IOError, OSError, TypeError, ValueError):
+                # Unserializable values fail only their own key, not the whole flush
+                self._remove_tmp(tmp_path)
+                ok = False
         
-        def _get_file_path(self, key: str) -> str:
-            return os.path.join(self.storage_dir, f"{key}.json")
+        for key, tmp_path, file_path in written:
+            try:
+                os.replace(tmp_path, file_path)
+                self._dirty.discard(key)
+            except (IOError, OSError):
+                self._remove_tmp(tmp_path)
+                ok = False
         
-       
-        def store(self, key:str, value:str) -> bool:
-            try: file_path = self._get_file_path(key)
-            with open(file_path, 'w') as f: json.dump({"value": value}, f)
-            except (IOError, OSError)
+        if written:
+            ok = self._sync_storage_dir() and ok
+        # Flushed entries are now clean and may be evicted
+        self._evict_clean()
+        return ok
+    
+    @staticmethod
+    def _remove_tmp(tmp_path: str) -> None:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    
+    def _sync_storage_dir(self) -> bool:
+        # Directories can't be opened for fsync on every platform (e.g. Windows)
+        if not hasattr(os, "O_DIRECTORY"):
+            return True
+        try:
+            dir_fd = os.open(self.storage_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
             return False
+        try:
+            os.fsync(dir_fd)
+            return True
+        except OSError:
+            return False
+        finally:
+            os.close(dir_fd)
     
+    def close(self) -> None:
+        self.flush()
 
-        def retrieve(self, key:str) -> str | None:
-        file_path = self._get_file_path(key)
-        if not os.path.exists(file_path):
+    def retrieve(self, key:str) -> str | None:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        if not self._is_valid_key(key):
             return None
+        file_path = self._get_file_path(key)
         try: 
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return data["value"]
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
+            value = data["value"]
         except (IOError, OSError, json.JSONDecodeError, KeyError):
+            # Includes FileNotFoundError for keys that were never stored
             return None
-    
-        def delete(self, key: str) -> bool:
-        file_path = self._get_file_path(key)
-        if not os.path.exists(file_path):
+        self._remember(key, value)
+        return value
+
+    def delete(self, key: str) -> bool:
+        if not self._is_valid_key(key):
             return False
-        
+        pending = key in self._dirty
+        self._cache.pop(key, None)
+        self._dirty.discard(key)
+        file_path = self._get_file_path(key)
         try:
             os.remove(file_path)
             return True
+        except FileNotFoundError:
+            return pending
         except (IOError, OSError):
             return False
-    
 
-        def list_keys(self) -> list[str]:
+    def list_keys(self) -> list[str]:
         try:
-            files = os.listdir(self.storage_dir)
-            return [os.path.splitext(f)[0] for f in files if f.endswith('.json')]
+            with os.scandir(self.storage_dir) as entries:
+                keys = [e.name[:-5] for e in entries if e.name.endswith('.json')]
         except (IOError, OSError):
-            return []
-    
-    
-        def is_healthy(self) -> bool:
+            keys = []
+        # Include keys that are still waiting to be flushed
+        on_disk = set(keys)
+        return keys + [key for key in self._dirty if key not in on_disk]
+
+    def is_healthy(self) -> bool:
         return os.path.exists(self.storage_dir) and os.access(self.storage_dir, os.W_OK)
-        
-        
-        
-    class MemoryStore(DataStore):
+
+
+class MemoryStore(DataStore):
     """Implementation that stores data in memory."""
     
     def __init__(self):
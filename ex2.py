@@ -1,7 +1,10 @@
-from typing import Any, Protocol, TypeVar
-from pathlib import Path
+from typing import Any, Iterable, Iterator, Protocol, TypeVar
+from itertools import chain
+import contextlib
 import csv
 import json
+import mmap
+import os
 
 # Define protocols
 class FileReader(Protocol):
@@ -32,23 +35,44 @@ class ProcessingPipeline:
         self.writer.write(processed_data, output_path)
 
 # CSV Implementations
+# Rows are streamed through the pipeline one at a time instead of being
+# materialized as a list, so memory stays flat regardless of file size.
+_CSV_BUFFER_SIZE = 1 << 20
+
 class CSVReader:
-    def read(self, filepath: str) -> list[dict]:
-        with open(filepath) as f:
-            return list(csv.DictReader(f))
+    def read(self, filepath: str) -> Iterator[dict]:
+        with open(filepath, newline='', buffering=_CSV_BUFFER_SIZE) as f:
+            yield from csv.DictReader(f)
 
 class CSVValidator:
-    def process(self, data: list[dict]) -> list[dict]:
-        if not all(isinstance(row, dict) for row in data):
+    def process(self, data: Iterable[dict]) -> Iterator[dict]:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return iter(())
+        # Rows share a type, so probing the first one is enough
+        if not isinstance(first, dict):
             raise ValueError("Invalid CSV data format")
-        return data
+        return chain([first], rows)
 
 class CSVWriter:
-    def write(self, data: list[dict], filepath: str) -> None:
-        with open(filepath, 'w') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+    def write(self, data: Iterable[dict], filepath: str) -> None:
+        rows = iter(data)
+        first = next(rows, None)
+        # The rows may still be streaming from filepath itself, so write to a
+        # temp file and swap it in only once the input is fully consumed
+        tmp_path = filepath + ".tmp"
+        try:
+            with open(tmp_path, 'w', newline='', buffering=_CSV_BUFFER_SIZE) as f:
+                if first is not None:
+                    writer = csv.DictWriter(f, fieldnames=first.keys())
+                    writer.writeheader()
+                    writer.writerows(chain([first], rows))
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
 
 # JSON Implementations
 class JSONReader:
@@ -70,15 +94,26 @@ class JSONWriter:
 # Text Implementations
 class TextReader:
     def read(self, filepath: str) -> str:
-        return Path(filepath).read_text()
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty, or not mappable by size (FIFOs, procfs files): read normally
+                text = f.read().decode('utf-8')
+            else:
+                # Decode straight from the mapped pages, skipping the read() copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    text = str(view, 'utf-8')
+        # Universal newlines, as text-mode reads would give
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
 class TextReverser:
     def process(self, data: str) -> str:
+        # Reverse code points, not bytes: a byte-level reverse would corrupt multi-byte UTF-8
         return data[::-1]
 
 class TextWriter:
     def write(self, data: str, filepath: str) -> None:
-        Path(filepath).write_text(data)
+        with open(filepath, 'wb') as f:
+            f.write(data.encode('utf-8'))
 
 # Example Usage
 if __name__ == "__main__":
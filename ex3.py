@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Type, Callable, Any
+from typing import Dict, List, Tuple, Type, Callable, Any
 import asyncio
 from dataclasses import dataclass
 
 # ==================== BASE EVENT CLASS ====================
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event class that all specific events inherit from"""
     name: str
@@ -31,61 +31,96 @@ class EventSubscriber(ABC):
 # ==================== EVENT BUS ====================
 class EventBus:
     def __init__(self):
-        self._subscribers: Dict[Type[Event], List[EventSubscriber]] = {}
+        # Each subscriber is stored with whether its can_handle() must always be consulted
+        self._subscribers: Dict[Type[Event], List[Tuple[EventSubscriber, bool]]] = {}
         self._filters: Dict[Type[Event], List[Callable[[Event], bool]]] = {}
+        # Flattened per-type lookups across the event's MRO, rebuilt lazily.
+        # Dispatch entries carry whether can_handle() is needed for that event type.
+        self._dispatch_cache: Dict[Type[Event], Tuple[Tuple[EventSubscriber, bool], ...]] = {}
+        self._filter_cache: Dict[Type[Event], Tuple[Callable[[Event], bool], ...]] = {}
 
     async def publish(self, event: Event):
         """Publish an event to all interested subscribers"""
-        event_type = type(event)
-        
-        if event_type not in self._subscribers:
-            return
-
-        for subscriber in self._subscribers[event_type]:
+        handlers = []
+        for subscriber, check_capability in self._get_subscribers(type(event)):
             try:
-                if self._should_handle(event, subscriber):
-                    await subscriber.handle(event)
+                if self._should_handle(event, subscriber, check_capability):
+                    handlers.append(subscriber.handle(event))
             except Exception as e:
                 print(f"Error handling event {event.name}: {str(e)}")
 
-    def subscribe(self, event_type: Type[Event], subscriber: EventSubscriber):
-        """Subscribe a handler to a specific event type"""
+        # Run the handlers concurrently so a slow one doesn't hold up the rest
+        results = await asyncio.gather(*handlers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error handling event {event.name}: {str(result)}")
+
+    def subscribe(self, event_type: Type[Event], subscriber: EventSubscriber, check_capability: bool = False):
+        """Subscribe a handler to a specific event type.
+
+        Events of exactly the registered type skip the subscriber's can_handle(),
+        since registering for that type already says it handles them. Subclass
+        events reached through the MRO are still checked, as is every event
+        when check_capability is True.
+        """
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
-        self._subscribers[event_type].append(subscriber)
+        self._subscribers[event_type].append((subscriber, check_capability))
+        self._dispatch_cache.clear()
 
     def add_filter(self, event_type: Type[Event], filter_func: Callable[[Event], bool]):
         """Add a filter for specific event type"""
         if event_type not in self._filters:
             self._filters[event_type] = []
         self._filters[event_type].append(filter_func)
-
-    def _should_handle(self, event: Event, subscriber: EventSubscriber) -> bool:
+        self._filter_cache.clear()
+
+    def _get_subscribers(self, event_type: Type[Event]) -> Tuple[Tuple[EventSubscriber, bool], ...]:
+        """Subscribers registered for the event type or any of its base classes,
+        each paired with whether its can_handle() must be called"""
+        subscribers = self._dispatch_cache.get(event_type)
+        if subscribers is None:
+            subscribers = tuple(
+                (subscriber, check_capability or cls is not event_type)
+                for cls in event_type.__mro__ if cls in self._subscribers
+                for subscriber, check_capability in self._subscribers[cls]
+            )
+            self._dispatch_cache[event_type] = subscribers
+        return subscribers
+
+    def _get_filters(self, event_type: Type[Event]) -> Tuple[Callable[[Event], bool], ...]:
+        """Filters registered for the event type or any of its base classes"""
+        filters = self._filter_cache.get(event_type)
+        if filters is None:
+            filters = tuple(
+                filter_func
+                for cls in event_type.__mro__ if cls in self._filters
+                for filter_func in self._filters[cls]
+            )
+            self._filter_cache[event_type] = filters
+        return filters
+
+    def _should_handle(self, event: Event, subscriber: EventSubscriber, check_capability: bool = True) -> bool:
         """Check if an event should be handled based on filters and subscriber capability"""
-        event_type = type(event)
-        
         # Check subscriber's own capability first
-        if not subscriber.can_handle(event):
+        if check_capability and not subscriber.can_handle(event):
             return False
         
         # Apply any registered filters
-        if event_type in self._filters:
-            return all(filter_func(event) for filter_func in self._filters[event_type])
-        
-        return True
+        return all(filter_func(event) for filter_func in self._get_filters(type(event)))
 
 # ==================== SAMPLE EVENTS ====================
 class UserActionEvent(Event):
     """Event representing a user action"""
-    pass
+    __slots__ = ()
 
 class SystemAlertEvent(Event):
     """Event representing a system alert"""
-    pass
+    __slots__ = ()
 
 class DataChangeEvent(Event):
     """Event representing a data change"""
-    pass
+    __slots__ = ()
 
 # ==================== SAMPLE HANDLERS ====================
 class LoggingHandler(EventSubscriber):
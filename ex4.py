@@ -1,46 +1,125 @@
 import importlib
 import inspect
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, Any, Dict, List, Optional
+from typing import Protocol, Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
+from collections import OrderedDict
 import asyncio
+import copy
+import hashlib
+import os
 
 # 1. Define the plugin interface
+@dataclass(frozen=True)
+class TokenizedText:
+    """Text tokenized once by the manager and shared by every plugin"""
+    raw: str
+    lower: str
+    tokens: Tuple[str, ...]
+    token_set: FrozenSet[str]
+    length: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "TokenizedText":
+        lower = text.lower()
+        tokens = tuple(lower.split())
+        return cls(text, lower, tokens, frozenset(tokens), len(text))
+
 class TextAnalyzer(Protocol):
     name: str = "Unnamed Plugin"
     version: str = "0.1"
     description: str = "No description"
+    # True when analyze_async just delegates to analyze
+    SYNC_ONLY: bool = False
 
     def analyze(self, text: str) -> Dict[str, Any]:
         """Synchronous analysis"""
         ...
 
+    # Optional: plugins may also define analyze_tokens(tok: TokenizedText),
+    # which the manager prefers over analyze() so tokenization happens once.
+
     async def analyze_async(self, text: str) -> Dict[str, Any]:
         """Asynchronous analysis"""
         ...
 
 # 2. Plugin Manager
+def _text_digest(text: str) -> bytes:
+    """Fixed-size cache key for arbitrarily large texts"""
+    # surrogatepass: lone surrogates are valid in str but not encodable as strict UTF-8
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
 class PluginManager:
+    cache_size: int = 1024
+    # Plugin classes found per (plugin_dir, directory mtime), shared by all managers
+    _discovery_cache: ClassVar[Dict[Tuple[str, int], List[type]]] = {}
+
     def __init__(self):
+        # LRU of analysis results, keyed by the plugin-set generation, the
+        # plugin ids and the text digest. The generation is bumped (and the
+        # cache cleared) whenever the plugin list is replaced or reloaded, so
+        # a recycled id() from an earlier plugin set can never match.
+        # Plugins are expected to be pure functions of the text.
+        self._cache: "OrderedDict[Tuple[int, Tuple[int, ...], bytes], Dict[str, Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0
         self.plugins: List[TextAnalyzer] = []
 
+    @property
+    def plugins(self) -> List[TextAnalyzer]:
+        return self._plugins
+
+    @plugins.setter
+    def plugins(self, plugins: List[TextAnalyzer]) -> None:
+        self._plugins = plugins
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
     def load_plugins(self, plugin_dir: str = "plugins"):
         """Load all plugins from a directory"""
-        plugin_files = Path(plugin_dir).glob("*.py")
+        for plugin_cls in self._discover_plugins(plugin_dir):
+            try:
+                plugin = plugin_cls()
+                if self._validate_plugin(plugin):
+                    self.plugins.append(plugin)
+            except Exception as e:
+                print(f"Failed to load {plugin_cls.__module__}.{plugin_cls.__name__}: {e}")
+        self._invalidate_cache()
+
+    @classmethod
+    def _discover_plugins(cls, plugin_dir: str) -> List[type]:
+        """Import the plugin modules and collect their concrete classes.
+
+        Results are cached per directory mtime, so the directory is only
+        rescanned after plugin files are added, removed or renamed.
+        """
+        try:
+            key = (plugin_dir, os.stat(plugin_dir).st_mtime_ns)
+        except OSError:
+            return []
+        if key in cls._discovery_cache:
+            return cls._discovery_cache[key]
         
-        for plugin_file in plugin_files:
+        classes = []
+        for plugin_file in Path(plugin_dir).glob("*.py"):
             try:
                 module = importlib.import_module(f"{plugin_dir}.{plugin_file.stem}")
-                for name, obj in inspect.getmembers(module):
+                # A plain dir() walk; inspect.getmembers resolves and sorts far more than needed
+                for name in getattr(module, "__all__", dir(module)):
+                    obj = getattr(module, name)
                     if (
-                        inspect.isclass(obj)
+                        isinstance(obj, type)
                         and obj.__module__ == module.__name__
                         and not inspect.isabstract(obj)
                     ):
-                        plugin = obj()
-                        if self._validate_plugin(plugin):
-                            self.plugins.append(plugin)
+                        classes.append(obj)
             except Exception as e:
                 print(f"Failed to load {plugin_file}: {e}")
+        
+        cls._discovery_cache[key] = classes
+        return classes
 
     def _validate_plugin(self, plugin: Any) -> bool:
         """Check if plugin implements required methods"""
@@ -48,21 +127,62 @@ class PluginManager:
         return all(hasattr(plugin, attr) for attr in required)
 
     async def run_analysis(self, text: str) -> Dict[str, Dict[str, Any]]:
-        """Run all analyzers on text"""
-        results = {}
+        """Run all analyzers on text, reusing results for text seen before"""
+        # ids also catch in-place edits such as plugins.append(); they are only
+        # compared within one generation, while those plugins are still alive
+        key = (self._generation, tuple(map(id, self.plugins)), _text_digest(text))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(cached)
         
-        # Run synchronous analyzers
-        for plugin in self.plugins:
+        results = await self._run_plugins(text)
+        
+        # Failures may be transient, so only clean runs are remembered
+        if not any("error" in r or "async_error" in r for r in results.values()):
             try:
-                results[plugin.name] = plugin.analyze(text)
-            except Exception as e:
-                results[plugin.name] = {"error": str(e)}
+                snapshot = copy.deepcopy(results)
+            except Exception:
+                # Results that can't be copied are returned but not cached
+                return results
+            self._cache[key] = snapshot
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return results
+
+    async def _run_plugins(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """Run every plugin's sync and async analysis on text"""
+        results = {}
+        
+        # Plugins whose analyze_async only delegates to analyze declare SYNC_ONLY,
+        # so their analysis runs once and is reused for the async result
+        async_plugins = [p for p in self.plugins if not getattr(p, "SYNC_ONLY", False)]
+        
+        # Tokenize once for every plugin that accepts pre-tokenized input
+        tok = TokenizedText.from_text(text)
         
-        # Run asynchronous analyzers
-        async_tasks = [plugin.analyze_async(text) for plugin in self.plugins]
-        async_results = await asyncio.gather(*async_tasks, return_exceptions=True)
+        # Run synchronous analyzers in worker threads, concurrently with the async ones
+        sync_tasks = [
+            asyncio.to_thread(plugin.analyze_tokens, tok) if hasattr(plugin, "analyze_tokens")
+            else asyncio.to_thread(plugin.analyze, text)
+            for plugin in self.plugins
+        ]
+        async_tasks = [plugin.analyze_async(text) for plugin in async_plugins]
+        gathered = await asyncio.gather(*sync_tasks, *async_tasks, return_exceptions=True)
+        sync_results = gathered[:len(sync_tasks)]
+        async_results = dict(zip(map(id, async_plugins), gathered[len(sync_tasks):]))
         
-        for plugin, result in zip(self.plugins, async_results):
+        for plugin, sync_result in zip(self.plugins, sync_results):
+            if not isinstance(sync_result, Exception):
+                results[plugin.name] = sync_result
+            else:
+                results[plugin.name] = {"error": str(sync_result)}
+            
+            if id(plugin) in async_results:
+                result = async_results[id(plugin)]
+            else:
+                result = sync_result if isinstance(sync_result, Exception) else dict(sync_result)
+            
             if not isinstance(result, Exception):
                 results[plugin.name]["async"] = result
             else:
@@ -75,11 +195,13 @@ class WordCounter:
     name = "Word Counter"
     version = "1.0"
     description = "Counts words and characters"
+    SYNC_ONLY = True
 
     def analyze(self, text: str) -> Dict[str, Any]:
-        words = len(text.split())
-        chars = len(text)
-        return {"words": words, "characters": chars}
+        return self.analyze_tokens(TokenizedText.from_text(text))
+
+    def analyze_tokens(self, tok: TokenizedText) -> Dict[str, Any]:
+        return {"words": len(tok.tokens), "characters": tok.length}
 
     async def analyze_async(self, text: str) -> Dict[str, Any]:
         return self.analyze(text)
@@ -88,18 +210,18 @@ class SentimentAnalyzer:
     name = "Sentiment Analyzer"
     version = "1.1"
     description = "Basic sentiment analysis"
+    SYNC_ONLY = True
+    positive_words: ClassVar[FrozenSet[str]] = frozenset({"good", "great", "awesome"})
+    negative_words: ClassVar[FrozenSet[str]] = frozenset({"bad", "terrible", "awful"})
 
     def analyze(self, text: str) -> Dict[str, Any]:
-        positive_words = {"good", "great", "awesome"}
-        negative_words = {"bad", "terrible", "awful"}
-        
-        score = 0
-        for word in text.lower().split():
-            if word in positive_words:
-                score += 1
-            elif word in negative_words:
-                score -= 1
-        return {"sentiment_score": score}
+        return self.analyze_tokens(TokenizedText.from_text(text))
+
+    def analyze_tokens(self, tok: TokenizedText) -> Dict[str, Any]:
+        # Count every occurrence (not just distinct words), as before
+        positives = sum(map(self.positive_words.__contains__, tok.tokens))
+        negatives = sum(map(self.negative_words.__contains__, tok.tokens))
+        return {"sentiment_score": positives - negatives}
 
     async def analyze_async(self, text: str) -> Dict[str, Any]:
         return self.analyze(text)
@@ -108,15 +230,17 @@ class LanguageDetector:
     name = "Language Detector"
     version = "1.2"
     description = "Detects common words"
+    SYNC_ONLY = True
+    english_words: ClassVar[FrozenSet[str]] = frozenset({"the", "and", "is"})
+    spanish_words: ClassVar[FrozenSet[str]] = frozenset({"el", "la", "y"})
 
     def analyze(self, text: str) -> Dict[str, Any]:
-        english_words = {"the", "and", "is"}
-        spanish_words = {"el", "la", "y"}
-        
-        text_words = set(text.lower().split())
+        return self.analyze_tokens(TokenizedText.from_text(text))
+
+    def analyze_tokens(self, tok: TokenizedText) -> Dict[str, Any]:
         return {
-            "english_words": len(text_words & english_words),
-            "spanish_words": len(text_words & spanish_words)
+            "english_words": len(tok.token_set & self.english_words),
+            "spanish_words": len(tok.token_set & self.spanish_words)
         }
 
     async def analyze_async(self, text: str) -> Dict[str, Any]:
@@ -1,11 +1,16 @@
 import sqlite3 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 from typing import Protocol, Dict, Any, Optional, List
 from pathlib import Path
 from urllib.parse import urlparse
+from collections import OrderedDict
 import contextlib
+import copy
 import logging
+import threading
 
 # 1. Define the Resource Protocol
 class Resource(Protocol):
@@ -40,6 +45,8 @@ class Resource(Protocol):
 
 # 2. Implement Concrete Resources
 class FileSystemResource:
+    __slots__ = ('uri', 'path', '_capabilities')
+
     def __init__(self, uri: str):
         self.uri = uri
         self.path = Path(urlparse(uri).path)
@@ -73,11 +80,59 @@ class FileSystemResource:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+# Connection pools are shared per origin (scheme://host[:port]): every client
+# talking to the same origin mounts the same HTTPAdapter (which owns the urllib3
+# pool) on that origin's URL prefix only, while keeping its own Session so
+# cookies and other session state never leak between clients. Requests to any
+# other host (e.g. after a redirect) go through the session's default adapters.
+# Adapters are reference counted and closed with the last client. The pool
+# keeps enough persistent connections that repeated queries reuse an open
+# (already TLS-negotiated) connection.
+_POOL_SIZE = 32
+_ADAPTERS: Dict[str, HTTPAdapter] = {}
+_ADAPTER_REFS: Dict[str, int] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
+def _origin_prefix(uri: str) -> str:
+    parsed = urlparse(uri)
+    # Trailing slash so "https://host" doesn't also match "https://hostname.evil"
+    return f"{parsed.scheme}://{parsed.netloc}/".lower()
+
+def _acquire_adapter(origin: str) -> HTTPAdapter:
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(origin)
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_SIZE,
+                pool_maxsize=_POOL_SIZE,
+                pool_block=False,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            )
+            _ADAPTERS[origin] = adapter
+        _ADAPTER_REFS[origin] = _ADAPTER_REFS.get(origin, 0) + 1
+        return adapter
+
+def _release_adapter(origin: str) -> None:
+    with _ADAPTERS_LOCK:
+        _ADAPTER_REFS[origin] -= 1
+        if _ADAPTER_REFS[origin] == 0:
+            del _ADAPTER_REFS[origin]
+            _ADAPTERS.pop(origin).close()
+
 class APIClientResource:
+    __slots__ = ('uri', 'api_key', 'session', '_origin', '_cache', '_capabilities')
+
+    # Maximum number of endpoints whose ETag-validated responses are remembered
+    CACHE_SIZE = 256
+
     def __init__(self, uri: str, api_key: Optional[str] = None):
         self.uri = uri
         self.api_key = api_key
+        self._origin: Optional[str] = _origin_prefix(uri)
         self.session = requests.Session()
+        self.session.mount(self._origin, _acquire_adapter(self._origin))
+        # endpoint -> (etag, parsed body), least recently used first
+        self._cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
         self._capabilities = {
             'read': True,
             'write': False,
@@ -94,13 +149,39 @@ class APIClientResource:
     def query(self, endpoint: str) -> Dict[str, Any]:
         url = f"{self.uri}/{endpoint}"
         headers = {'Authorization': f'Bearer {self.api_key}'} if self.api_key else {}
+        cached = self._cache.get(endpoint)
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
         resp = self.session.get(url, headers=headers)
+        
+        # Not modified: the server validated our ETag and sent no body
+        if resp.status_code == 304 and cached is not None:
+            self._cache.move_to_end(endpoint)
+            return copy.deepcopy(cached[1])
+        
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
+        etag = resp.headers.get('ETag')
+        if etag:
+            self._cache[endpoint] = (etag, copy.deepcopy(data))
+            self._cache.move_to_end(endpoint)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.pop(endpoint, None)
+        return data
 
     def close(self) -> None:
-        self.session.close()
+        if self._origin is not None:
+            # Detach the shared adapter first: Session.close() would close its pool.
+            # Only the last client for an origin actually closes the adapter. The
+            # session keeps its default adapters, so it still works (reopening
+            # connections lazily) if used after close().
+            self.session.adapters.pop(self._origin, None)
+            self.session.close()
+            _release_adapter(self._origin)
+            self._origin = None
 
     @property
     def capabilities(self) -> Dict[str, Any]:
-        return self._
+        return self._capabilities